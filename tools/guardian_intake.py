@@ -1,23 +1,41 @@
 #!/usr/bin/env python3
 import json
 import os
+import re
 import subprocess
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from jsonschema import Draft202012Validator
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - jsonschema-only fallback
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_SIGNAL = ROOT / "interfaces" / "signals.schema.json"
 SCHEMA_CARECASE = ROOT / "interfaces" / "care-case.schema.json"
 OUT_DIR = ROOT / "generated"
+CASE_ID_NAMESPACE = uuid.UUID("00000000-0000-0000-0000-000000000000")
 
+# Diff paths worth turning into care-cases, matched on raw git output bytes.
+EXAMPLE_SIGNAL_RE = re.compile(rb"^(?:.*/)?examples/signal\.[^/]*\.json$")
+SIGNAL_RE = re.compile(rb"^signals/(?:.*/)?[^/]+\.json$")
 
-def _run(cmd: List[str]) -> str:
-    return subprocess.check_output(cmd, cwd=ROOT, text=True).strip()
+
+def _run(cmd: List[str]) -> bytes:
+    return subprocess.check_output(cmd, cwd=ROOT)
 
 
 def changed_signal_files() -> List[Path]:
@@ -26,19 +44,20 @@ def changed_signal_files() -> List[Path]:
     after = os.environ.get("GITHUB_SHA")
     try:
         if before and after and before != "0000000000000000000000000000000000000000":
-            diff = _run(["bash", "-lc", f"git diff --name-only {before} {after}"])
+            diff = _run(["git", "diff", "--name-only", before, after])
         else:
-            diff = _run(["bash", "-lc", "git diff --name-only HEAD~1 HEAD"])
+            diff = _run(["git", "diff", "--name-only", "HEAD~1", "HEAD"])
     except subprocess.CalledProcessError as exc:
         print(f"Failed to compute git diff: {exc}")
         return []
     paths = []
-    for line in diff.splitlines():
-        p = Path(line.strip())
-        if not p:
+    for line in diff.split(b"\n"):
+        name = line.strip()
+        if not name:
             continue
-        if p.match("examples/signal.*.json") or str(p).startswith("signals/") and p.suffix == ".json":
-            paths.append(ROOT / p)
+        # Only the surviving lines are decoded into str/Path objects.
+        if EXAMPLE_SIGNAL_RE.match(name) or SIGNAL_RE.match(name):
+            paths.append(ROOT / name.decode("utf-8"))
     return paths
 
 
@@ -51,15 +70,88 @@ def load_schema(path: Path) -> Dict[str, Any]:
     return load_json(path)
 
 
-def validate(instance: Dict[str, Any], schema: Dict[str, Any], label: str) -> None:
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(instance), key=lambda e: e.path)
-    if errors:
-        msg_lines = [f"{label} validation failed:"]
-        for e in errors:
-            loc = ".".join([str(x) for x in e.absolute_path]) or "(root)"
-            msg_lines.append(f"- {loc}: {e.message}")
-        raise SystemExit("\n".join(msg_lines))
+@lru_cache(maxsize=None)
+def load_validator(path: Path) -> Draft202012Validator:
+    """
+    Compile a schema once; the validator is reused for every instance.
+    """
+    return Draft202012Validator(load_schema(path))
+
+
+# Draft 2019-09/2020-12 keywords fastjsonschema silently ignores (it treats the
+# schema as draft-07); any of them means only jsonschema may decide validity.
+_FAST_UNSUPPORTED_KEYWORDS = frozenset(
+    {
+        "prefixItems",
+        "dependentRequired",
+        "dependentSchemas",
+        "unevaluatedProperties",
+        "unevaluatedItems",
+        "minContains",
+        "maxContains",
+        "$anchor",
+        "$dynamicRef",
+        "$dynamicAnchor",
+        "$recursiveRef",
+        "$recursiveAnchor",
+        "$vocabulary",
+    }
+)
+
+
+def _uses_unsupported_keywords(node: Any) -> bool:
+    if isinstance(node, dict):
+        if _FAST_UNSUPPORTED_KEYWORDS.intersection(node):
+            return True
+        return any(_uses_unsupported_keywords(v) for v in node.values())
+    if isinstance(node, list):
+        return any(_uses_unsupported_keywords(v) for v in node)
+    return False
+
+
+@lru_cache(maxsize=None)
+def load_fast_validator(path: Path) -> Optional[Callable[[Any], Any]]:
+    """
+    Codegen validator used as a fast pass; None when fastjsonschema is unavailable,
+    cannot compile the schema, or the schema uses keywords it would ignore.
+    Formats are not asserted and defaults are not written into the instance,
+    matching jsonschema.
+    """
+    if fastjsonschema is None:
+        return None
+    schema = load_schema(path)
+    if _uses_unsupported_keywords(schema):
+        return None
+    try:
+        return fastjsonschema.compile(schema, use_formats=False, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def validate(
+    instance: Dict[str, Any],
+    validator: Draft202012Validator,
+    label: str,
+    fast_validator: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    if fast_validator is not None:
+        try:
+            fast_validator(instance)
+            return
+        except fastjsonschema.JsonSchemaException:
+            # jsonschema stays authoritative and produces the full error report.
+            pass
+    error_iter = validator.iter_errors(instance)
+    first = next(error_iter, None)
+    if first is None:
+        return
+    # Only an invalid instance pays for collecting and sorting the full report.
+    errors = sorted([first, *error_iter], key=lambda e: e.path)
+    msg_lines = [f"{label} validation failed:"]
+    for e in errors:
+        loc = ".".join([str(x) for x in e.absolute_path]) or "(root)"
+        msg_lines.append(f"- {loc}: {e.message}")
+    raise SystemExit("\n".join(msg_lines))
 
 
 def gate_from_tension(t: float) -> str:
@@ -79,17 +171,22 @@ def recommended_action(gate: str, kind: str, severity: str) -> str:
     return "human_review"
 
 
+_BASE_CONSTRAINTS = ("reversibility-first", "minimal-intervention", "explainability", "human-seniority")
+# Keyed by (gate is green, kind is security); the only four reachable constraint sets.
+_CONSTRAINTS = {
+    (True, False): _BASE_CONSTRAINTS,
+    (True, True): _BASE_CONSTRAINTS + ("no-secrets",),
+    (False, False): _BASE_CONSTRAINTS + ("canary-required",),
+    (False, True): _BASE_CONSTRAINTS + ("canary-required", "no-secrets"),
+}
+
+
 def constraints_for(signal: Dict[str, Any], gate: str) -> List[str]:
-    base = ["reversibility-first", "minimal-intervention", "explainability", "human-seniority"]
-    if gate != "green":
-        base.append("canary-required")
-    if signal.get("kind") == "security":
-        base.append("no-secrets")
-    return base
+    return list(_CONSTRAINTS[(gate == "green", signal.get("kind") == "security")])
 
 
 def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
 def build_carecase(signal: Dict[str, Any]) -> Dict[str, Any]:
@@ -129,16 +226,20 @@ def build_carecase(signal: Dict[str, Any]) -> Dict[str, Any]:
     return carecase
 
 
+@lru_cache(maxsize=1024)
 def _derive_case_id(signal_id: str) -> str:
     """
     Deterministic, stable UUID using a fixed namespace.
     """
-    ns = uuid.UUID("00000000-0000-0000-0000-000000000000")
-    return str(uuid.uuid5(ns, f"carecase:{signal_id}"))
+    return str(uuid.uuid5(CASE_ID_NAMESPACE, f"carecase:{signal_id}"))
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # orjson indents in C; the stdlib encoder falls back to pure Python with indent.
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
         f.write("\n")
@@ -152,6 +253,32 @@ def set_github_output(name: str, value: str) -> None:
         f.write(f"{name}={value}\n")
 
 
+def process_signal(sp: Path) -> Path:
+    """
+    Turn one signal file into a validated care-case file. Runs in worker
+    processes, so validators come from the per-process module cache.
+    """
+    signal = load_json(sp)
+    validate(
+        signal,
+        load_validator(SCHEMA_SIGNAL),
+        f"Signal ({sp.as_posix()})",
+        load_fast_validator(SCHEMA_SIGNAL),
+    )
+
+    carecase = build_carecase(signal)
+    validate(
+        carecase,
+        load_validator(SCHEMA_CARECASE),
+        "Care-Case (generated)",
+        load_fast_validator(SCHEMA_CARECASE),
+    )
+
+    out_file = OUT_DIR / f"carecase.{signal['id']}.json"
+    write_json(out_file, carecase)
+    return out_file
+
+
 def main() -> None:
     signal_paths = changed_signal_files()
     if not signal_paths:
@@ -160,23 +287,16 @@ def main() -> None:
         print("No changed signal files detected.")
         return
 
-    schema_signal = load_schema(SCHEMA_SIGNAL)
-    schema_case = load_schema(SCHEMA_CARECASE)
-
     OUT_DIR.mkdir(parents=True, exist_ok=True)
-    generated: List[Path] = []
-
-    for sp in signal_paths:
-        signal = load_json(sp)
-        validate(signal, schema_signal, f"Signal ({sp.as_posix()})")
-
-        carecase = build_carecase(signal)
-        validate(carecase, schema_case, "Care-Case (generated)")
-
-        out_file = OUT_DIR / f"carecase.{signal['id']}.json"
-        write_json(out_file, carecase)
-        generated.append(out_file)
-
+    generated: List[Path]
+    if len(signal_paths) > 1:
+        workers = min(len(signal_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            generated = list(ex.map(process_signal, signal_paths))
+    else:
+        generated = [process_signal(sp) for sp in signal_paths]
+
+    for out_file in generated:
         print(f"Generated care-case: {out_file.as_posix()}")
 
     # Expose outputs to workflow
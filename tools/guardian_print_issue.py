@@ -4,6 +4,11 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 
 
@@ -15,6 +20,12 @@ def load_json(path_str: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+def _pretty_json(data: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
 def title(case: Dict[str, Any]) -> str:
     gate = case.get("policy_gate", "unknown")
     summary = case.get("summary", "Unnamed care-case")
@@ -34,45 +45,48 @@ def body(case: Dict[str, Any]) -> str:
     signals = case.get("signals", [])
     signal_ids = [s.get("signal_id") for s in signals if isinstance(s, dict)]
 
-    pretty_json = json.dumps(case, ensure_ascii=False, indent=2)
-
-    lines = []
-    lines.append(f"**System:** `{sys_name}`  \n**Env:** `{sys_env}`  \n**Version:** `{sys_ver}`")
-    lines.append("")
-    lines.append(f"**Policy gate:** `{gate}`")
-    lines.append(f"**Recommended action:** `{action}`")
-    lines.append(f"**Tension:** `{tension}`")
-    lines.append("")
-    if signal_ids:
-        lines.append("**Signals:**")
-        for sid in signal_ids:
-            lines.append(f"- `{sid}`")
-        lines.append("")
-    if constraints:
-        lines.append("**Constraints:**")
-        for c in constraints:
-            lines.append(f"- `{c}`")
-        lines.append("")
-    if case.get("root_cause_hypothesis"):
-        lines.append("**Root-cause hypothesis (not a fact):**")
-        lines.append(case["root_cause_hypothesis"])
-        lines.append("")
+    signal_block = (
+        "**Signals:**\n" + "".join(f"- `{sid}`\n" for sid in signal_ids) + "\n"
+        if signal_ids
+        else ""
+    )
+    constraint_block = (
+        "**Constraints:**\n" + "".join(f"- `{c}`\n" for c in constraints) + "\n"
+        if constraints
+        else ""
+    )
+    hypothesis_block = (
+        f"**Root-cause hypothesis (not a fact):**\n{case['root_cause_hypothesis']}\n\n"
+        if case.get("root_cause_hypothesis")
+        else ""
+    )
+    transition_block = ""
     if case.get("proposed_transition"):
         pt = case["proposed_transition"]
-        lines.append("**Proposed transition (intent):**")
-        lines.append(f"- intent: {pt.get('intent')}")
-        lines.append(f"- scope: {pt.get('scope')}")
-        lines.append(f"- reversibility: {pt.get('reversibility')}")
         v = pt.get("verification", [])
-        if v:
-            lines.append("- verification:")
-            for item in v:
-                lines.append(f"  - {item}")
-        lines.append("")
-    lines.append("```json")
-    lines.append(pretty_json)
-    lines.append("```")
-    return "\n".join(lines)
+        verification_block = (
+            "- verification:\n" + "".join(f"  - {item}\n" for item in v) if v else ""
+        )
+        transition_block = (
+            "**Proposed transition (intent):**\n"
+            f"- intent: {pt.get('intent')}\n"
+            f"- scope: {pt.get('scope')}\n"
+            f"- reversibility: {pt.get('reversibility')}\n"
+            f"{verification_block}\n"
+        )
+
+    return (
+        f"**System:** `{sys_name}`  \n**Env:** `{sys_env}`  \n**Version:** `{sys_ver}`\n"
+        "\n"
+        f"**Policy gate:** `{gate}`\n"
+        f"**Recommended action:** `{action}`\n"
+        f"**Tension:** `{tension}`\n"
+        "\n"
+        f"{signal_block}{constraint_block}{hypothesis_block}{transition_block}"
+        "```json\n"
+        f"{_pretty_json(case)}\n"
+        "```"
+    )
 
 
 def main() -> None:
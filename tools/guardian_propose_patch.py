@@ -1,12 +1,50 @@
 #!/usr/bin/env python3
 import json
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 GENERATED_DIR = ROOT / "generated"
 PATCH_DIR = ROOT / "guardian" / "patches"
+PR_LIST_LIMIT = 1000
+# Listing every PR pages through up to PR_LIST_LIMIT results; below this many
+# proposals, one gh pr list --head query per case is cheaper.
+PR_BATCH_LOOKUP_MIN = 10
+# Shared read-only fallback for optional mappings; never mutate.
+_EMPTY: Dict[str, Any] = {}
+
+PATCH_STUB_TEMPLATE = (
+    "# Guardian Patch Proposal ({id})\n\n"
+    "## Root cause hypothesis\n"
+    "{root_cause_hypothesis}\n\n"
+    "## Suggested patch steps (generic web perf)\n"
+    "1. Audit critical rendering path (hero images, fonts, blocking scripts).\n"
+    "2. Defer or async non-critical scripts; ensure bundles are split appropriately.\n"
+    "3. Optimize images (proper sizing, modern formats, preload hero assets).\n"
+    "4. Reduce server response time (cache headers, CDN, origin optimization).\n\n"
+    "## Signals\n"
+    "{signal_lines}\n\n"
+    "## Verification checklist\n"
+    "{checklist}\n"
+)
+
+PR_BODY_TEMPLATE = (
+    "## Guardian Proposed Patch (green)\n\n"
+    "**Care-Case:** `{id}`\n"
+    "**Gate:** `{policy_gate}`\n"
+    "**Action:** `{recommended_action}`\n"
+    "**Tension:** `{tension}`\n\n"
+    "### Signals\n"
+    "{signal_lines}\n\n"
+    "### Proposed transition\n"
+    "- intent: {intent}\n"
+    "- scope: {scope}\n"
+    "- reversibility: {reversibility}\n\n"
+    "### Verification checklist\n"
+    "{checklist}\n"
+)
 
 
 def _run(cmd: List[str], check: bool = True) -> str:
@@ -36,12 +74,11 @@ def _list_cases() -> Iterable[Path]:
 
 
 def _is_reversible_proposal(case: Dict[str, Any]) -> bool:
-    if case.get("policy_gate") != "green":
-        return False
-    if case.get("recommended_action") != "propose_patch":
-        return False
-    transition = case.get("proposed_transition") or {}
-    return transition.get("reversibility") == "reversible"
+    return (
+        case.get("policy_gate") == "green"
+        and case.get("recommended_action") == "propose_patch"
+        and (case.get("proposed_transition") or _EMPTY).get("reversibility") == "reversible"
+    )
 
 
 def _existing_pr(branch: str) -> bool:
@@ -62,9 +99,41 @@ def _existing_pr(branch: str) -> bool:
     return output.strip() not in ("", "[]")
 
 
-def _remote_branch_exists(branch: str) -> bool:
-    output = _run(["git", "ls-remote", "--heads", "origin", branch], check=False)
-    return bool(output)
+def _existing_pr_heads() -> Optional[Set[str]]:
+    """
+    Head branches of all PRs in one gh call. None when the listing hit the
+    limit and may be incomplete; callers then fall back to _existing_pr().
+    """
+    output = _run(
+        [
+            "gh",
+            "pr",
+            "list",
+            "--state",
+            "all",
+            "--json",
+            "headRefName",
+            "--limit",
+            str(PR_LIST_LIMIT),
+        ],
+        check=True,
+    )
+    prs = json.loads(output) if output else []
+    if len(prs) >= PR_LIST_LIMIT:
+        return None
+    return {pr["headRefName"] for pr in prs}
+
+
+def _remote_guardian_branches() -> Set[str]:
+    output = _run(
+        ["git", "ls-remote", "--heads", "origin", "refs/heads/guardian/*"],
+        check=False,
+    )
+    return {
+        line.split("\t", 1)[1][len("refs/heads/"):]
+        for line in output.splitlines()
+        if "\t" in line
+    }
 
 
 def _configure_git_identity() -> None:
@@ -75,19 +144,21 @@ def _configure_git_identity() -> None:
     )
 
 
-def _log_repo_context() -> None:
+@lru_cache(maxsize=None)
+def _repo_view() -> Dict[str, Any]:
+    # One gh call serves both the context log and the default branch lookup.
     output = _run(
-        [
-            "gh",
-            "repo",
-            "view",
-            "--json",
-            "nameWithOwner",
-            "--jq",
-            ".nameWithOwner",
-        ],
+        ["gh", "repo", "view", "--json", "nameWithOwner,defaultBranchRef"],
         check=False,
     )
+    try:
+        return json.loads(output) if output else {}
+    except json.JSONDecodeError:
+        return {}
+
+
+def _log_repo_context() -> None:
+    output = _repo_view().get("nameWithOwner")
     if output:
         print(f"gh repo context: {output}")
     else:
@@ -100,91 +171,60 @@ def _log_repo_context() -> None:
         print("gh actor: unknown")
 
 
-def _has_staged_changes() -> bool:
-    result = subprocess.run(
-        ["git", "diff", "--cached", "--quiet"],
-        cwd=ROOT,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    return result.returncode != 0
-
-
 def _checkout_branch(branch: str, base_branch: str) -> None:
     _run(["git", "fetch", "origin", base_branch], check=True)
     _run(["git", "checkout", "-B", branch, f"origin/{base_branch}"], check=True)
 
 
 def _default_branch() -> str:
-    output = _run(
-        [
-            "gh",
-            "repo",
-            "view",
-            "--json",
-            "defaultBranchRef",
-            "--jq",
-            ".defaultBranchRef.name",
-        ],
-        check=False,
-    )
-    return output.strip() or "main"
+    ref = _repo_view().get("defaultBranchRef") or {}
+    return ref.get("name") or "main"
 
 
-def _write_patch_stub(case: Dict[str, Any]) -> Path:
-    PATCH_DIR.mkdir(parents=True, exist_ok=True)
-    case_id = case["id"]
-    path = PATCH_DIR / f"{case_id}.md"
-    transition = case.get("proposed_transition") or {}
+def _template_fields(case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect every template placeholder once; case and transition fields are
+    read from their own mappings so neither can shadow the other.
+    """
+    transition = case.get("proposed_transition") or _EMPTY
     verification = transition.get("verification") or []
     signals = case.get("signals") or []
 
-    checklist = "\n".join([f"- [ ] {item}" for item in verification])
-    signal_lines = "\n".join([f"- {sig.get('signal_id', 'unknown')}" for sig in signals])
-
-    content = (
-        f"# Guardian Patch Proposal ({case_id})\n\n"
-        f"## Root cause hypothesis\n"
-        f"{case.get('root_cause_hypothesis', 'TBD')}\n\n"
-        "## Suggested patch steps (generic web perf)\n"
-        "1. Audit critical rendering path (hero images, fonts, blocking scripts).\n"
-        "2. Defer or async non-critical scripts; ensure bundles are split appropriately.\n"
-        "3. Optimize images (proper sizing, modern formats, preload hero assets).\n"
-        "4. Reduce server response time (cache headers, CDN, origin optimization).\n\n"
-        "## Signals\n"
-        f"{signal_lines or '- (none)'}\n\n"
-        "## Verification checklist\n"
-        f"{checklist or '- [ ] Add verification steps'}\n"
-    )
+    return {
+        "id": case.get("id", "unknown"),
+        "policy_gate": case.get("policy_gate", "unknown"),
+        "recommended_action": case.get("recommended_action", "unknown"),
+        "tension": case.get("tension", "unknown"),
+        "root_cause_hypothesis": case.get("root_cause_hypothesis", "TBD"),
+        "intent": transition.get("intent", "TBD"),
+        "scope": transition.get("scope", "TBD"),
+        "reversibility": transition.get("reversibility", "TBD"),
+        "checklist": (
+            "\n".join(f"- [ ] {item}" for item in verification) or "- [ ] Add verification steps"
+        ),
+        "signal_lines": (
+            "\n".join(f"- {sig.get('signal_id', 'unknown')}" for sig in signals) or "- (none)"
+        ),
+    }
+
+
+def _write_patch_stub(case: Dict[str, Any]) -> Tuple[Path, bool]:
+    """
+    Write the patch stub; the flag is False when the checked-out file already
+    has this content, i.e. there would be nothing to commit.
+    """
+    PATCH_DIR.mkdir(parents=True, exist_ok=True)
+    path = PATCH_DIR / f"{case['id']}.md"
+    content = PATCH_STUB_TEMPLATE.format_map(_template_fields(case))
 
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return path, False
     path.write_text(content, encoding="utf-8")
-    return path
+    return path, True
 
 
 def _build_pr_body(case: Dict[str, Any]) -> str:
-    transition = case.get("proposed_transition") or {}
-    verification = transition.get("verification") or []
-    signals = case.get("signals") or []
-
-    checklist = "\n".join([f"- [ ] {item}" for item in verification])
-    signal_lines = "\n".join([f"- {sig.get('signal_id', 'unknown')}" for sig in signals])
-
-    return (
-        "## Guardian Proposed Patch (green)\n\n"
-        f"**Care-Case:** `{case.get('id', 'unknown')}`\n"
-        f"**Gate:** `{case.get('policy_gate', 'unknown')}`\n"
-        f"**Action:** `{case.get('recommended_action', 'unknown')}`\n"
-        f"**Tension:** `{case.get('tension', 'unknown')}`\n\n"
-        "### Signals\n"
-        f"{signal_lines or '- (none)'}\n\n"
-        "### Proposed transition\n"
-        f"- intent: {transition.get('intent', 'TBD')}\n"
-        f"- scope: {transition.get('scope', 'TBD')}\n"
-        f"- reversibility: {transition.get('reversibility', 'TBD')}\n\n"
-        "### Verification checklist\n"
-        f"{checklist or '- [ ] Add verification steps'}\n"
-    )
+    return PR_BODY_TEMPLATE.format_map(_template_fields(case))
 
 
 def _post_pr_metadata(pr_url: str) -> None:
@@ -205,12 +245,11 @@ def _post_pr_metadata(pr_url: str) -> None:
 
 
 def _get_pr_url_by_head(branch: str) -> str:
-    url = _run(
+    return _run(
         [
             "gh",
             "pr",
             "view",
-            "--head",
             branch,
             "--json",
             "url",
@@ -218,13 +257,7 @@ def _get_pr_url_by_head(branch: str) -> str:
             ".url",
         ],
         check=False,
-    ).strip()
-    if not url:
-        url = _run(
-            ["gh", "pr", "view", "--head", branch, "--json", "url", "--jq", ".url"],
-            check=False,
-        ).strip()
-    return url
+    )
 
 
 def main() -> None:
@@ -237,43 +270,46 @@ def main() -> None:
     _log_repo_context()
     base_branch = _default_branch()
 
-    created_any = False
-    for path in cases:
-        case = _load_json(path)
-        if not _is_reversible_proposal(case):
-            continue
+    proposals = [case for case in map(_load_json, cases) if _is_reversible_proposal(case)]
+    # One ls-remote for all guardian branches; PRs are listed in bulk only for large batches.
+    pr_heads = _existing_pr_heads() if len(proposals) >= PR_BATCH_LOOKUP_MIN else None
+    remote_branches = _remote_guardian_branches() if proposals else set()
 
+    created_any = False
+    for case in proposals:
         case_id = case["id"]
         branch = f"guardian/{case_id}"
 
-        if _existing_pr(branch):
+        pr_exists = branch in pr_heads if pr_heads is not None else _existing_pr(branch)
+        if pr_exists:
             print(f"PR already exists for {case_id}, skipping.")
             continue
 
-        if _remote_branch_exists(branch):
+        if branch in remote_branches:
             print(f"Remote branch {branch} exists, skipping.")
             continue
 
         _checkout_branch(branch, base_branch)
 
-        patch_path = _write_patch_stub(case)
-        _run(["git", "add", patch_path.as_posix()], check=True)
-        if not _has_staged_changes():
+        patch_path, changed = _write_patch_stub(case)
+        if not changed:
             print(f"No changes for {case_id}, skipping commit/PR.")
             _run(
                 ["git", "checkout", "-B", base_branch, f"origin/{base_branch}"],
                 check=False,
             )
             continue
+        _run(["git", "add", patch_path.as_posix()], check=True)
         _run(
             ["git", "commit", "-m", f"Guardian propose patch for {case_id}"],
             check=True,
         )
         _run(["git", "push", "-u", "origin", branch], check=True)
+        remote_branches.add(branch)
 
         pr_title = f"Guardian proposed patch: {case_id}"
         pr_body = _build_pr_body(case)
-        _run(
+        created = _run(
             [
                 "gh",
                 "pr",
@@ -291,7 +327,10 @@ def main() -> None:
             ],
             check=True,
         )
-        pr_url = _get_pr_url_by_head(branch)
+        # gh pr create prints the new PR URL; only query by head if it did not.
+        last_line = created.splitlines()[-1] if created else ""
+        pr_url = last_line if last_line.startswith("https://") else ""
+        pr_url = pr_url or _get_pr_url_by_head(branch)
         if pr_url:
             _post_pr_metadata(pr_url)
         else:
@@ -8,8 +8,16 @@ from typing import List, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 
-PATCH_RE = re.compile(r"^guardian/patches/([0-9a-fA-F-]{36})\.md$")
-BRANCH_RE = re.compile(r"^guardian/[0-9a-fA-F-]{36}$")
+PATCH_RE = re.compile(r"^guardian/patches/([0-9a-fA-F-]{36})\.md$", re.ASCII)
+BRANCH_RE = re.compile(r"^guardian/[0-9a-fA-F-]{36}$", re.ASCII)
+
+REQUIRED_SECTIONS = (
+    "# Guardian Patch Proposal",
+    "## Root cause hypothesis",
+    "## Suggested patch steps",
+    "## Verification checklist",
+)
+SECTIONS_RE = re.compile("|".join(re.escape(section) for section in REQUIRED_SECTIONS))
 
 
 def _run(cmd: List[str], check: bool = True) -> str:
@@ -35,7 +43,7 @@ def _env(name: str) -> str:
 
 
 def _changed_files(base: str, head: str) -> List[str]:
-    output = _run(["bash", "-lc", f"git diff --name-only {base} {head}"], check=True)
+    output = _run(["git", "diff", "--name-only", base, head], check=True)
     return [line.strip() for line in output.splitlines() if line.strip()]
 
 
@@ -57,13 +65,25 @@ def _enforce_branch_format(branch: str) -> None:
         )
 
 
-def _enforce_only_patch_files(files: List[str]) -> None:
-    bad = [file_path for file_path in files if not file_path.startswith("guardian/patches/")]
+def _collect_patch_files(files: List[str]) -> List[Tuple[str, str]]:
+    """
+    Single pass over the diff: reject files outside guardian/patches/ and
+    return (path, case_id) for every patch file.
+    """
+    bad: List[str] = []
+    patch_files: List[Tuple[str, str]] = []
+    for file_path in files:
+        match = PATCH_RE.match(file_path)
+        if match:
+            patch_files.append((file_path, match.group(1)))
+        elif not file_path.startswith("guardian/patches/"):
+            bad.append(file_path)
     if bad:
         raise SystemExit(
             "Guardian PR must only modify files under guardian/patches/. Offenders: "
             + ", ".join(bad)
         )
+    return patch_files
 
 
 def _validate_patch_markdown(path: str, case_id: str) -> List[str]:
@@ -73,17 +93,12 @@ def _validate_patch_markdown(path: str, case_id: str) -> List[str]:
         errors.append(f"{path}: file missing or unreadable")
         return errors
 
-    required_sections = [
-        "# Guardian Patch Proposal",
-        "## Root cause hypothesis",
-        "## Suggested patch steps",
-        "## Verification checklist",
-    ]
-    for needle in required_sections:
-        if needle not in content:
+    found = {m.group(0) for m in SECTIONS_RE.finditer(content)}
+    for needle in REQUIRED_SECTIONS:
+        if needle not in found:
             errors.append(f"{path}: missing section marker: {needle}")
 
-    if case_id.lower() not in content.lower():
+    if not re.search(re.escape(case_id), content, re.IGNORECASE):
         errors.append(f"{path}: does not mention case id {case_id}")
 
     if "- [ ]" not in content:
@@ -104,14 +119,7 @@ def main() -> None:
     _enforce_branch_format(branch)
 
     files = _changed_files(base, head)
-    _enforce_only_patch_files(files)
-    patch_files: List[Tuple[str, str]] = []
-
-    for file_path in files:
-        match = PATCH_RE.match(file_path)
-        if match:
-            patch_files.append((file_path, match.group(1)))
-
+    patch_files = _collect_patch_files(files)
     if not patch_files:
         raise SystemExit(
             "Guardian PR must include at least one patch file under guardian/patches/<case_id>.md"